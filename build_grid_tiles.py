@@ -0,0 +1,154 @@
+"""Build the level-of-detail grid tiles used by the dashboard's high-density map.
+
+Reads gridded accessibility points (one row per raster cell or settlement
+point) and pre-bins them into square grid cells at several resolutions, so the
+dashboard only ever ships aggregated cells instead of raw points.
+
+Input columns (CSV or Parquet):
+    lon, lat        point coordinates (WGS 84)
+    State           state name, matching healthcare_accessibility_data.csv
+    population      population represented by the point
+    travel_time_m   travel time to the nearest health center, motorized (minutes)
+    travel_time_w   travel time to the nearest health center, walking (minutes)
+
+Points with zero population are dropped, so every output cell is populated.
+Points with a missing or infinite coordinate, population or travel time (e.g.
+an "unreachable" marker) are dropped too, so every output value is finite.
+
+Output (Parquet, sorted by level and State so row groups can be skipped):
+    level, cell_size, lon, lat (south-west corner of the cell), State,
+    population, travel_time_m, travel_time_w (population-weighted means) and
+    HAC_M_<t>/HAC_W_<t> (% population within each threshold).
+
+    Each level is written twice: once per state (a cell crossing a border is
+    split between its states) and once state-agnostic with State = "India",
+    where every cell appears exactly once for the all-India map.
+
+Index (CSV sidecar, "<output>_index.csv"):
+    level, State, cells, cell_size and lon/lat extent of every (level, State)
+    block, so the dashboard can pick a level without scanning the tiles.
+
+Usage:
+    python build_grid_tiles.py points.parquet
+    python build_grid_tiles.py points.csv --output grid_accessibility_tiles.parquet
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Cell sizes in degrees, coarsest first (level 0 = all of India at a glance)
+LEVEL_CELL_SIZES = [0.5, 0.1, 0.02, 0.005]
+
+# State name of the state-agnostic cells, matching the India row of the dataset
+NATIONAL_STATE = "India"
+
+# Thresholds (minutes) matching the HAC-M and HAC-W variables in the dashboard
+THRESHOLDS = {
+    "HAC_M": ("travel_time_m", [30, 60, 90, 120]),
+    "HAC_W": ("travel_time_w", [60, 120, 240])
+}
+
+
+def load_points(path):
+    """Load raw accessibility points from a CSV or Parquet file"""
+    if path.endswith(".parquet"):
+        points = pd.read_parquet(path)
+    else:
+        points = pd.read_csv(path)
+
+    missing = {"lon", "lat", "State", "population", "travel_time_m", "travel_time_w"} - set(points.columns)
+    if missing:
+        raise ValueError(f"Input is missing required columns: {', '.join(sorted(missing))}")
+    return points
+
+
+def aggregate_cells(binned, keys):
+    """Sum binned points per cell and turn the weighted sums into population-weighted values"""
+    cells = binned.groupby(keys, sort=False).sum().reset_index()
+    weighted_cols = [col for col in cells.columns if col not in ("State", "lon", "lat", "population")]
+    cells[weighted_cols] = cells[weighted_cols].div(cells["population"], axis=0)
+    hac_cols = [col for col in weighted_cols if col.startswith("HAC_")]
+    cells[hac_cols] = cells[hac_cols] * 100
+    return cells
+
+
+def bin_level(points, level, cell_size):
+    """Aggregate points into square cells of `cell_size` degrees"""
+    population = points["population"].to_numpy(dtype=float)
+    binned = pd.DataFrame({
+        "State": points["State"].to_numpy(),
+        "lon": np.floor(points["lon"].to_numpy(dtype=float) / cell_size) * cell_size,
+        "lat": np.floor(points["lat"].to_numpy(dtype=float) / cell_size) * cell_size,
+        "population": population
+    })
+
+    # Population-weighted sums, divided by cell population after grouping
+    for prefix, (time_col, thresholds) in THRESHOLDS.items():
+        travel_time = points[time_col].to_numpy(dtype=float)
+        binned[time_col] = population * travel_time
+        for threshold in thresholds:
+            binned[f"{prefix}_{threshold}"] = population * (travel_time <= threshold)
+
+    state_cells = aggregate_cells(binned, ["State", "lon", "lat"])
+    national_cells = aggregate_cells(binned.drop(columns="State"), ["lon", "lat"])
+    national_cells.insert(0, "State", NATIONAL_STATE)
+
+    cells = pd.concat([state_cells, national_cells], ignore_index=True)
+    cells.insert(0, "level", level)
+    cells.insert(1, "cell_size", cell_size)
+    return cells
+
+
+def build_tiles(points):
+    """Bin points at every level of detail into a single table"""
+    # Unpopulated points (common in gridded rasters) carry no access information
+    # and would leave cells with undefined population-weighted values; non-finite
+    # inputs would skew cell means or reach the browser as invalid JSON
+    numeric_cols = ["lon", "lat", "population", "travel_time_m", "travel_time_w"]
+    finite = np.isfinite(points[numeric_cols].to_numpy(dtype=float)).all(axis=1)
+    points = points[finite & (points["population"] > 0)]
+    levels = [bin_level(points, level, size) for level, size in enumerate(LEVEL_CELL_SIZES)]
+    return pd.concat(levels, ignore_index=True).sort_values(["level", "State", "lat", "lon"])
+
+
+def build_index(tiles):
+    """Summarise the cell count, cell size and extent of every (level, State) block"""
+    return tiles.groupby(["level", "State"]).agg(
+        cells=("lon", "size"),
+        cell_size=("cell_size", "first"),
+        lon_min=("lon", "min"),
+        lon_max=("lon", "max"),
+        lat_min=("lat", "min"),
+        lat_max=("lat", "max")
+    ).reset_index()
+
+
+def index_path(output):
+    """Path of the sidecar index written next to the tiles file"""
+    return os.path.splitext(output)[0] + "_index.csv"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("points", help="CSV or Parquet file of accessibility points")
+    parser.add_argument(
+        "--output",
+        default="grid_accessibility_tiles.parquet",
+        help="Output Parquet file (default: grid_accessibility_tiles.parquet)"
+    )
+    args = parser.parse_args()
+
+    tiles = build_tiles(load_points(args.points))
+    # Small row groups let the dashboard read a single level/state without scanning the file
+    pq.write_table(pa.Table.from_pandas(tiles, preserve_index=False), args.output, row_group_size=50_000)
+    build_index(tiles).to_csv(index_path(args.output), index=False)
+    print(f"Wrote {len(tiles):,} cells across {len(LEVEL_CELL_SIZES)} levels to {args.output}")
+    print(f"Wrote tile index to {index_path(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,10 @@ import numpy as np
 from plotly.subplots import make_subplots
 import requests
 import json
+import os
+import threading
+import pydeck as pdk
+import pyarrow.parquet as pq
 
 # Page configuration
 st.set_page_config(
@@ -120,22 +124,110 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Dashboard options shared by the widgets, the URL deep links and the cache warmer
+VIEW_OPTIONS = {
+    "🗺️ Variable View": "variable",
+    "🏛️ State View": "state"
+}
+
+VARIABLE_OPTIONS = {
+    "HAC-M": "hac_m",
+    "HAC-W": "hac_w"
+}
+
+TIME_OPTIONS = {
+    "hac_m": {"30 minutes": "30", "60 minutes": "60", "90 minutes": "90", "120 minutes": "120"},
+    "hac_w": {"60 minutes": "60", "120 minutes": "120", "240 minutes": "240"}
+}
+
+MAP_MODE_OPTIONS = {
+    "State choropleth": "choropleth",
+    "High-density grid": "grid"
+}
+
+GRID_METRIC_OPTIONS = {
+    "% within threshold": "within",
+    "Mean travel time": "time"
+}
+
+# Pre-binned level-of-detail grid tiles (built with build_grid_tiles.py)
+GRID_TILES_FILE = "grid_accessibility_tiles.parquet"
+GRID_TILES_INDEX_FILE = "grid_accessibility_tiles_index.csv"
+
+# Upper bound on grid cells sent to the browser for a single map render
+MAX_GRID_CELLS = 100_000
+
+# Cached State View figures kept per builder: room for the warmed default
+# selection of every state plus recently used user-chosen combinations
+STATE_VIEW_CACHE_ENTRIES = 500
+
+# Grid decks kept in memory (each holds up to MAX_GRID_CELLS cells and their JSON)
+GRID_DECK_CACHE_ENTRIES = 8
+
+# URL query parameters owned by each view; the others are dropped so links stay canonical
+VIEW_QUERY_PARAMS = {
+    "variable": ["var", "t", "map", "focus", "cell"],
+    "state": ["state", "vars"]
+}
+
+# Query parameters that only apply to the high-density grid map mode
+GRID_QUERY_PARAMS = ["focus", "cell"]
+
+def seed_widget_from_query_param(widget_key, param, options, default):
+    """Initialise a widget's session state from a URL query parameter.
+
+    `options` maps widget labels to the codes used in the URL. The widget keeps
+    its current value if it is still valid, otherwise the query parameter (or
+    `default` when the parameter is missing or unknown) is used.
+    """
+    if st.session_state.get(widget_key) in options:
+        return
+    labels_by_code = {code: label for label, code in options.items()}
+    st.session_state[widget_key] = labels_by_code.get(st.query_params.get(param), default)
+
+def sync_query_params(params, stale=()):
+    """Write the current widget selections back to the URL query parameters.
+
+    Parameters listed in `stale` no longer apply to what is on screen and are
+    removed, so a shared link only carries the selections it actually uses.
+    """
+    for param in stale:
+        if param in st.query_params:
+            del st.query_params[param]
+    for param, value in params.items():
+        if isinstance(value, list):
+            if st.query_params.get_all(param) != value:
+                if value:
+                    st.query_params[param] = value
+                elif param in st.query_params:
+                    del st.query_params[param]
+        elif st.query_params.get(param) != value:
+            st.query_params[param] = value
+
 # Sidebar for view selection
 st.sidebar.header("🏥 DIPICA Dashboard")
 st.sidebar.markdown("---")
 
+seed_widget_from_query_param("view_selection", "view", VIEW_OPTIONS, "🗺️ Variable View")
 view_selection = st.sidebar.radio(
     "Select View:",
-    ["🗺️ Variable View", "🏛️ State View"],
-    index=0,
+    list(VIEW_OPTIONS.keys()),
+    key="view_selection",
     help="Choose between Variable-focused analysis or State-focused analysis"
 )
+sync_query_params(
+    {"view": VIEW_OPTIONS[view_selection]},
+    stale=[
+        param for view, params in VIEW_QUERY_PARAMS.items()
+        if view != VIEW_OPTIONS[view_selection] for param in params
+    ]
+)
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("""
-**Variable View**: Analyze healthcare accessibility by selecting specific variables and viewing national patterns with state-wise maps and rural-urban comparisons.
+**Variable View**: Analyze healthcare accessibility by selecting specific variables and viewing national patterns with state-wise maps, rural-urban comparisons and equity measures.
 
-**State View**: Compare states by selecting multiple variables and viewing national benchmarks, radar comparisons, and rural-urban gaps.
+**State View**: Compare states by selecting multiple variables and viewing national benchmarks, radar comparisons, rural-urban gaps and equity measures.
 """)
 
 # Title with DIPICA logo - Side by side centered layout
@@ -166,7 +258,7 @@ with col2:
 st.markdown("---")
 
 # Load data with caching
-@st.cache_data
+@st.cache_data(show_spinner=False)
 def load_data():
     """Load the healthcare accessibility dataset"""
     try:
@@ -176,6 +268,567 @@ def load_data():
         st.error("Dataset file 'healthcare_accessibility_data.csv' not found!")
         return None
 
+def hac_columns(variable_type, time_value):
+    """Return the (total, rural, urban) column names for a HAC variable and threshold"""
+    prefix = "HAC_M" if variable_type == "hac_m" else "HAC_W"
+    return (
+        f"{prefix}_{time_value}_Total",
+        f"{prefix}_{time_value}_Rural",
+        f"{prefix}_{time_value}_Urban"
+    )
+
+def get_states(df):
+    """Return the sorted list of states (excluding the India total row)"""
+    states = [state for state in df['State'].unique() if state != 'India']
+    states.sort()  # Sort alphabetically
+    return states
+
+def get_variable_display_names(columns):
+    """Map user-friendly names of the "Total" variables to their column names"""
+    # Get all variable columns (excluding State and population columns)
+    population_cols = ['Total_Population', 'Rural_Population', 'Urban_Population']
+    all_variable_columns = [col for col in columns if col not in ['State'] + population_cols]
+
+    # Filter to only include "Total" variables (exclude Rural and Urban variants)
+    total_variable_columns = [col for col in all_variable_columns if col.endswith('_Total')]
+
+    # Create user-friendly variable names for Total variables only
+    variable_display_names = {}
+    for col in total_variable_columns:
+        if col.startswith('HAC_M_'):
+            # HAC Motorized transport
+            parts = col.split('_')
+            time = parts[2]
+            display_name = f"HAC-M {time}min"
+        elif col.startswith('HAC_W_'):
+            # HAC Walking
+            parts = col.split('_')
+            time = parts[2]
+            display_name = f"HAC-W {time}min"
+        else:
+            display_name = col
+        variable_display_names[display_name] = col
+    return variable_display_names
+
+def weighted_gini(values, weights):
+    """Population-weighted Gini coefficient of every column of `values`.
+
+    `values` and `weights` are (units x variables) arrays; each column is
+    sorted independently and the Gini is read off its weighted Lorenz curve.
+    """
+    order = np.argsort(values, axis=0)
+    x = np.take_along_axis(values, order, axis=0)
+    p = np.take_along_axis(weights, order, axis=0)
+    p = p / p.sum(axis=0)
+
+    # Cumulative share of the accessible population along the Lorenz curve
+    lorenz = np.cumsum(p * x, axis=0) / (p * x).sum(axis=0)
+    lorenz_prev = np.vstack([np.zeros((1, lorenz.shape[1])), lorenz[:-1]])
+    return 1 - (p * (lorenz + lorenz_prev)).sum(axis=0)
+
+def weighted_concentration_index(values, weights, rank_by):
+    """Population-weighted concentration index of every column of `values`.
+
+    Units are ranked by `rank_by` (one value per unit); a positive index means
+    access is concentrated in the units ranked highest.
+    """
+    order = np.argsort(rank_by)
+    x = values[order]
+    p = weights[order] / weights.sum(axis=0)
+
+    # Weighted fractional rank of each unit (midpoint of its population share)
+    rank = np.cumsum(p, axis=0) - p / 2
+    mean = (p * x).sum(axis=0)
+    return 2 * (p * x * rank).sum(axis=0) / mean - 1
+
+@st.cache_data(show_spinner=False)
+def compute_inequality_cube():
+    """Population-weighted inequality metrics for every HAC variable and threshold.
+
+    All `HAC_M_*`/`HAC_W_*` columns are computed in one vectorized pass over the
+    units of analysis (every row except the India total), each weighted by its
+    matching `*_Population` column. Units with a missing value or population in
+    a column get zero weight for that column only. Returns one row per "Total"
+    column with:
+
+    - Mean (%): population-weighted mean access
+    - Gini / Gini (Rural) / Gini (Urban): weighted Gini of access across units
+    - Concentration Index: access ranked by urbanisation (urban population share)
+    - Rural/Urban Ratio: weighted rural mean over weighted urban mean
+    """
+    df = load_data()
+    units = df[df['State'] != 'India']
+
+    hac_cols = [col for col in df.columns if col.startswith(('HAC_M_', 'HAC_W_'))]
+    population_cols = [f"{col.rsplit('_', 1)[1]}_Population" for col in hac_cols]
+
+    values = units[hac_cols].to_numpy(dtype=float)
+    weights = units[population_cols].to_numpy(dtype=float)
+
+    # Mask gaps per column: a missing unit drops out instead of turning the whole column NaN
+    valid = np.isfinite(values) & np.isfinite(weights)
+    values = np.where(valid, values, 0.0)
+    weights = np.where(valid, weights, 0.0)
+    urban_share = (units['Urban_Population'] / units['Total_Population']).to_numpy(dtype=float)
+
+    metrics = pd.DataFrame(
+        {
+            'Weighted Mean': (weights * values).sum(axis=0) / weights.sum(axis=0),
+            'Gini': weighted_gini(values, weights),
+            'Concentration Index': weighted_concentration_index(values, weights, urban_share)
+        },
+        index=pd.MultiIndex.from_tuples(
+            [tuple(col.rsplit('_', 1)) for col in hac_cols], names=['Variable', 'Area']
+        )
+    ).unstack('Area')
+
+    cube = pd.DataFrame({
+        'Mean (%)': metrics[('Weighted Mean', 'Total')],
+        'Gini': metrics[('Gini', 'Total')],
+        'Gini (Rural)': metrics[('Gini', 'Rural')],
+        'Gini (Urban)': metrics[('Gini', 'Urban')],
+        'Concentration Index': metrics[('Concentration Index', 'Total')],
+        'Rural/Urban Ratio': metrics[('Weighted Mean', 'Rural')] / metrics[('Weighted Mean', 'Urban')]
+    })
+
+    # Index by "Total" column name, in dataset order, to match the widgets
+    cube.index = cube.index + '_Total'
+    return cube.reindex([col for col in hac_cols if col.endswith('_Total')])
+
+@st.cache_data(show_spinner=False)
+def build_state_map(variable_type, time_value):
+    """Build the statewise choropleth for a HAC variable and threshold"""
+    df_viz = load_data()
+    total_col, _, _ = hac_columns(variable_type, time_value)
+
+    # Create enhanced choropleth map using shapefile
+    color_label = "% Population"
+    color_scale = 'Viridis'
+
+    # Create the figure
+    fig_map = go.Figure(data=go.Choropleth(
+        geojson="https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson",
+        featureidkey='properties.ST_NM',
+        locationmode='geojson-id',
+        locations=df_viz['State'],
+        z=df_viz[total_col],
+        zmin=0,
+        zmax=100,
+        autocolorscale=False,
+        colorscale=color_scale,
+        marker_line_color='white',
+        marker_line_width=0.5,
+        hovertemplate='<b>%{location}</b><br>' + color_label + ': %{z:.1f}<extra></extra>',
+        colorbar=dict(
+            title={'text': color_label},
+            thickness=15,
+            len=0.6,
+            bgcolor='rgba(255,255,255,0.8)',
+            xanchor='left',
+            x=0.01,
+            yanchor='bottom',
+            y=0.1,
+            tick0=0,
+            dtick=20
+        )
+    ))
+
+    # Update geos
+    fig_map.update_geos(
+        visible=False,
+        projection=dict(
+            type='conic conformal',
+            parallels=[12.472944444, 35.172805555556],
+            rotation={'lat': 24, 'lon': 80}
+        ),
+        lonaxis={'range': [68, 98]},
+        lataxis={'range': [6, 38]}
+    )
+
+    # Update layout
+    fig_map.update_layout(
+        margin={'r': 0, 't': 0, 'l': 0, 'b': 0},
+        height=800,
+        width=None
+    )
+    return fig_map
+
+@st.cache_data(show_spinner=False)
+def build_rural_urban_range(variable_type, time_value):
+    """Build the statewise rural vs urban range plot for a HAC variable and threshold"""
+    df_range = load_data()
+    total_col, rural_col, urban_col = hac_columns(variable_type, time_value)
+    transport_type = "motorized transport" if variable_type == "hac_m" else "walking"
+
+    df_sorted = df_range.sort_values(total_col, ascending=True)
+
+    fig_range = go.Figure()
+
+    # Add rural values
+    fig_range.add_trace(go.Scatter(
+        x=df_sorted[rural_col],
+        y=df_sorted['State'],
+        mode='markers',
+        name='Rural',
+        marker=dict(color='#FF6B6B', size=10, symbol='circle'),
+        hovertemplate='<b>%{y}</b><br>Rural: %{x:.1f}%<extra></extra>'
+    ))
+
+    # Add urban values
+    fig_range.add_trace(go.Scatter(
+        x=df_sorted[urban_col],
+        y=df_sorted['State'],
+        mode='markers',
+        name='Urban',
+        marker=dict(color='#4ECDC4', size=10, symbol='diamond'),
+        hovertemplate='<b>%{y}</b><br>Urban: %{x:.1f}%<extra></extra>'
+    ))
+
+    # Add range lines
+    for idx, row in df_sorted.iterrows():
+        fig_range.add_trace(go.Scatter(
+            x=[row[rural_col], row[urban_col]],
+            y=[row['State'], row['State']],
+            mode='lines',
+            line=dict(color='#A8DADC', width=3),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+
+    fig_range.update_layout(
+        xaxis_title=f"% population within {time_value} min to nearest center via {transport_type}",
+        yaxis_title="",
+        height=800,
+        hovermode='closest',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=0, r=0, t=0, b=0),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5,
+            bgcolor='rgba(255,255,255,0.8)',
+            bordercolor='rgba(0,0,0,0.2)',
+            borderwidth=1
+        )
+    )
+
+    fig_range.update_xaxes(gridcolor='lightgray', gridwidth=0.5)
+    fig_range.update_yaxes(gridcolor='lightgray', gridwidth=0.5)
+    return fig_range
+
+def grid_tiles_version():
+    """Modification times of the grid tiles and their index, or None if either is missing.
+
+    Passed to the grid caches as part of their key, so rebuilding the tiles
+    with build_grid_tiles.py takes effect without restarting the server.
+    """
+    if not (os.path.exists(GRID_TILES_FILE) and os.path.exists(GRID_TILES_INDEX_FILE)):
+        return None
+    return (os.path.getmtime(GRID_TILES_FILE), os.path.getmtime(GRID_TILES_INDEX_FILE))
+
+@st.cache_data(max_entries=1)
+def load_grid_tile_index(tiles_version):
+    """Cell count, cell size and extent of every (level, State) block in the grid tiles.
+
+    Reads the small sidecar index written by build_grid_tiles.py rather than
+    the tiles themselves.
+    """
+    return pd.read_csv(GRID_TILES_INDEX_FILE)
+
+def choose_grid_level(tile_index, focus_state):
+    """Pick the finest level whose cells for the focus extent fit in MAX_GRID_CELLS.
+
+    `focus_state` is a state name, or 'India' for the state-agnostic cells that
+    cover the whole country with each cell exactly once.
+    """
+    tile_index = tile_index[tile_index['State'] == focus_state]
+    cells_per_level = tile_index.groupby('level')['cells'].sum().sort_index()
+    fitting = cells_per_level[cells_per_level <= MAX_GRID_CELLS]
+    # Fall back to the coarsest level if even that exceeds the budget
+    return int(fitting.index.max()) if not fitting.empty else int(cells_per_level.index.min())
+
+def load_grid_cells(level, focus_state, value_col):
+    """Read one level of grid cells for a state (or 'India') with only the columns the map needs"""
+    filters = [('level', '=', level), ('State', '=', focus_state)]
+    cells = pq.read_table(
+        GRID_TILES_FILE,
+        columns=['lon', 'lat', 'population', value_col],
+        filters=filters
+    ).to_pandas()
+    return cells.rename(columns={value_col: 'value'})
+
+@st.cache_resource(show_spinner="Loading grid cells...", max_entries=GRID_DECK_CACHE_ENTRIES)
+def build_grid_deck(tiles_version, level, focus_state, value_col, metric, transport_type):
+    """Build the pydeck grid-cell layer for one level of pre-binned accessibility cells.
+
+    Cached per slice and metric with the deck's JSON serialised once, so reruns
+    for unrelated widgets don't re-read or re-serialise up to MAX_GRID_CELLS cells.
+    """
+    tile_index = load_grid_tile_index(tiles_version)
+    level_blocks = tile_index[(tile_index['level'] == level) & (tile_index['State'] == focus_state)]
+    cell_size = float(level_blocks['cell_size'].iloc[0])
+
+    # Only this level/state slice of the tiles file is read; per-cell fields are
+    # kept to the minimum and rounded, since every rerun resends the spec
+    cells = load_grid_cells(level, focus_state, value_col)
+    cells = cells.round({'lon': 6, 'lat': 6, 'value': 1})
+    cells['population'] = cells['population'].round().astype('int64')
+    if metric == "within":
+        shade = "value"
+        tooltip_value = "{value}% population within threshold"
+    else:
+        # Shorter travel time is better: 0 min shades like 100% access, 240+ min like 0%
+        shade = "(100 - (value < 240 ? value : 240) / 2.4)"
+        tooltip_value = "{value} min mean travel time via " + transport_type
+    focus_label = "All India" if focus_state == 'India' else focus_state
+
+    lon_min, lon_max = level_blocks['lon_min'].min(), level_blocks['lon_max'].max()
+    lat_min, lat_max = level_blocks['lat_min'].min(), level_blocks['lat_max'].max()
+    span = max(lon_max - lon_min, lat_max - lat_min, cell_size)
+    view_state = pdk.ViewState(
+        longitude=(lon_min + lon_max + cell_size) / 2,
+        latitude=(lat_min + lat_max + cell_size) / 2,
+        zoom=float(np.clip(np.log2(360 / span) - 0.5, 3, 12)),
+        pitch=0
+    )
+
+    # Cells are binned in degrees, so draw each as its exact lon/lat rectangle
+    # from the south-west corner (a metre-sized square would overlap neighbours)
+    layer = pdk.Layer(
+        "PolygonLayer",
+        data=cells,
+        get_polygon=(
+            f"[[lon, lat], [lon + {cell_size!r}, lat], "
+            f"[lon + {cell_size!r}, lat + {cell_size!r}], [lon, lat + {cell_size!r}]]"
+        ),
+        stroked=False,
+        filled=True,
+        # Red (#FF6B6B) at 0 to teal (#4ECDC4) at 100, matching the rural/urban colours
+        get_fill_color=f"[255 - {shade} * 1.77, 107 + {shade} * 0.98, 107 + {shade} * 0.89, 200]",
+        extruded=False,
+        pickable=True
+    )
+
+    deck = pdk.Deck(
+        layers=[layer],
+        initial_view_state=view_state,
+        tooltip={"text": focus_label + "\n" + tooltip_value + "\nPopulation: {population}"}
+    )
+
+    # st.pydeck_chart calls to_json() on every rerun; serialise the cells only once
+    deck_json = deck.to_json()
+    deck.to_json = lambda: deck_json
+    return deck
+
+@st.cache_data(show_spinner=False, max_entries=STATE_VIEW_CACHE_ENTRIES)
+def build_state_radar(selected_state, categories, columns):
+    """Build the India vs state radar chart for the selected variables"""
+    df = load_data()
+    india_data = df[df['State'] == 'India'].iloc[0]
+    state_data = df[df['State'] == selected_state].iloc[0]
+
+    national_values = [india_data[col] for col in columns]
+    state_values = [state_data[col] for col in columns]
+
+    # Create radar chart
+    fig = go.Figure()
+
+    # Add national values (first web)
+    fig.add_trace(go.Scatterpolar(
+        r=national_values,
+        theta=list(categories),
+        fill='toself',
+        name='India',
+        line=dict(color='#4ECDC4', width=2),
+        fillcolor='rgba(78, 205, 196, 0.2)'
+    ))
+
+    # Add state values (second web)
+    fig.add_trace(go.Scatterpolar(
+        r=state_values,
+        theta=list(categories),
+        fill='toself',
+        name=selected_state,
+        line=dict(color='#FF6B6B', width=2),
+        fillcolor='rgba(255, 107, 107, 0.2)'
+    ))
+
+    # Update layout with proper configuration
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                ticksuffix='%'
+            )
+        ),
+        showlegend=True,
+        height=500,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5
+        ),
+        # Enable proper plotly controls
+        margin=dict(l=50, r=50, t=50, b=50)
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=STATE_VIEW_CACHE_ENTRIES)
+def build_state_rural_urban_gap(selected_state, categories, columns):
+    """Build the state's rural-urban range plot, or None if no variable has rural/urban data"""
+    df = load_data()
+    state_data = df[df['State'] == selected_state].iloc[0]
+
+    # Get variables that have rural and urban data
+    rural_urban_variables = []
+    for display_name, col_name in zip(categories, columns):
+        # Check if rural and urban columns exist for this variable
+        rural_col = col_name.replace('_Total', '_Rural')
+        urban_col = col_name.replace('_Total', '_Urban')
+
+        if rural_col in df.columns and urban_col in df.columns:
+            rural_urban_variables.append({
+                'display_name': display_name,
+                'rural_col': rural_col,
+                'urban_col': urban_col,
+                'rural_value': state_data[rural_col],
+                'urban_value': state_data[urban_col]
+            })
+
+    if not rural_urban_variables:
+        return None
+
+    # Create range plot
+    fig_range = go.Figure()
+
+    # Prepare data for the plot
+    variable_names = [var['display_name'] for var in rural_urban_variables]
+    rural_values = [var['rural_value'] for var in rural_urban_variables]
+    urban_values = [var['urban_value'] for var in rural_urban_variables]
+
+    # Add rural values
+    fig_range.add_trace(go.Scatter(
+        x=rural_values,
+        y=variable_names,
+        mode='markers',
+        name='Rural',
+        marker=dict(color='#FF6B6B', size=10, symbol='circle'),
+        hovertemplate='<b>%{y}</b><br>Rural: %{x:.1f}%<extra></extra>'
+    ))
+
+    # Add urban values
+    fig_range.add_trace(go.Scatter(
+        x=urban_values,
+        y=variable_names,
+        mode='markers',
+        name='Urban',
+        marker=dict(color='#4ECDC4', size=10, symbol='diamond'),
+        hovertemplate='<b>%{y}</b><br>Urban: %{x:.1f}%<extra></extra>'
+    ))
+
+    # Add range lines connecting rural and urban values
+    for i, var in enumerate(rural_urban_variables):
+        fig_range.add_trace(go.Scatter(
+            x=[var['rural_value'], var['urban_value']],
+            y=[var['display_name'], var['display_name']],
+            mode='lines',
+            line=dict(color='#A8DADC', width=3),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+
+    # Update layout
+    fig_range.update_layout(
+        xaxis_title="Percentage (%)",
+        yaxis_title="",
+        height=400,
+        hovermode='closest',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=0, r=0, t=0, b=0),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5,
+            bgcolor='rgba(255,255,255,0.8)',
+            bordercolor='rgba(0,0,0,0.2)',
+            borderwidth=1
+        ),
+        yaxis=dict(side='left'),  # Only show left y-axis
+        showlegend=True
+    )
+
+    # Remove axis lines, keep only horizontal grid
+    fig_range.update_xaxes(
+        showline=False,
+        showgrid=False,
+        zeroline=False,
+        range=[0, None],  # Start x-axis from 0
+        tick0=0,  # Start ticks from 0
+        dtick=20  # Tick interval
+    )
+    fig_range.update_yaxes(
+        showline=False,
+        showgrid=True,
+        gridcolor='lightgray',
+        gridwidth=0.5
+    )
+    return fig_range
+
+def default_state_view_variables(variable_display_names):
+    """Return the variables the State View selects by default (first 5)"""
+    return list(variable_display_names.keys())[:5]
+
+def warm_dashboard_caches():
+    """Pre-build the cached figures behind the most common dashboard links.
+
+    Covers every Variable View combination (HAC-M and HAC-W at each threshold)
+    and the default State View selection for every state, so deep links open
+    on a cache hit instead of a cold render.
+    """
+    df = load_data()
+    if df is None:
+        return False
+
+    for variable_type, time_options in TIME_OPTIONS.items():
+        for time_value in time_options.values():
+            build_state_map(variable_type, time_value)
+            build_rural_urban_range(variable_type, time_value)
+
+    compute_inequality_cube()
+
+    if df[df['State'] == 'India'].empty:
+        return True
+
+    variable_display_names = get_variable_display_names(df.columns)
+    categories = tuple(default_state_view_variables(variable_display_names))
+    columns = tuple(variable_display_names[var] for var in categories)
+    for state in get_states(df):
+        build_state_radar(state, categories, columns)
+        build_state_rural_urban_gap(state, categories, columns)
+    return True
+
+@st.cache_resource(show_spinner=False)
+def start_cache_warmer():
+    """Run warm_dashboard_caches in a background thread, once per server process.
+
+    Streamlit has no server-startup hook, so the thread is started by the first
+    script run; that run renders normally instead of waiting for the warm-up.
+    The builders it calls are cached with show_spinner=False, since a spinner
+    has no script context in this thread.
+    """
+    warmer = threading.Thread(target=warm_dashboard_caches, name="dashboard-cache-warmer", daemon=True)
+    warmer.start()
+    return warmer
+
 # Load the dataset
 df = load_data()
 
@@ -184,6 +837,9 @@ if df is None:
     st.info("💡 You can create the dataset by running the data generation script first.")
     st.stop()
 
+# Pre-build the cached figures in the background so shared links open warm
+start_cache_warmer()
+
 # Conditional rendering based on view selection
 if view_selection == "🗺️ Variable View":
     # VARIABLE VIEW - Original dashboard.py content
@@ -198,53 +854,33 @@ if view_selection == "🗺️ Variable View":
     # Main area filters
     with filter_col1:
         # Variable selection
-        variable_options = {
-            "HAC-M": "hac_m",
-            "HAC-W": "hac_w"
-        }
-
+        seed_widget_from_query_param("selected_variable", "var", VARIABLE_OPTIONS, "HAC-M")
         selected_variable = st.selectbox(
             "Select Variable to Visualize:",
-            options=list(variable_options.keys()),
-            index=0
+            options=list(VARIABLE_OPTIONS.keys()),
+            key="selected_variable"
         )
 
-        variable_type = variable_options[selected_variable]
+        variable_type = VARIABLE_OPTIONS[selected_variable]
 
     with filter_col2:
-        # Time threshold selection (only for HAC variables)
-        if variable_type in ["hac_m", "hac_w"]:
-            if variable_type == "hac_m":
-                time_options = {"30 minutes": "30", "60 minutes": "60", "90 minutes": "90", "120 minutes": "120"}
-            else:  # hac_w
-                time_options = {"60 minutes": "60", "120 minutes": "120", "240 minutes": "240"}
-
-            selected_time = st.selectbox(
-                f"Select Time Threshold:",
-                options=list(time_options.keys()),
-                index=0
-            )
+        # Time threshold selection (options depend on the selected variable)
+        time_options = TIME_OPTIONS[variable_type]
+
+        seed_widget_from_query_param("selected_time", "t", time_options, list(time_options.keys())[0])
+        selected_time = st.selectbox(
+            f"Select Time Threshold:",
+            options=list(time_options.keys()),
+            key="selected_time"
+        )
 
-            time_value = time_options[selected_time]
+        time_value = time_options[selected_time]
 
-            # Build column names
-            if variable_type == "hac_m":
-                total_col = f"HAC_M_{time_value}_Total"
-                rural_col = f"HAC_M_{time_value}_Rural"
-                urban_col = f"HAC_M_{time_value}_Urban"
-            else:
-                total_col = f"HAC_W_{time_value}_Total"
-                rural_col = f"HAC_W_{time_value}_Rural"
-                urban_col = f"HAC_W_{time_value}_Urban"
-
-    # Initialize variables if not set (for cases where time selection is skipped)
-    if 'total_col' not in locals():
-        # Default to HAC-M 30min if not selected
-        total_col = "HAC_M_30_Total"
-        rural_col = "HAC_M_30_Rural"
-        urban_col = "HAC_M_30_Urban"
-        variable_type = "hac_m"
-        selected_time = "30 minutes"
+        # Build column names
+        total_col, rural_col, urban_col = hac_columns(variable_type, time_value)
+
+    # Keep the URL in sync so the current selection can be shared as a link
+    sync_query_params({"var": variable_type, "t": time_value})
 
     # === TOP SECTION: KEY METRICS TILES ===
     st.header("📊 National Overview")
@@ -290,83 +926,133 @@ if view_selection == "🗺️ Variable View":
         label=var_abbrev,
         value=f"{national_avg:.1f}%"
     )
+
+    # Equity measures across states, from the cached inequality cube
+    equity = compute_inequality_cube().loc[total_col]
+    eq_col1, eq_col2, eq_col3, eq_col4 = st.columns(4)
+    with eq_col1:
+        st.metric(
+            label="Gini (population-weighted)",
+            value=f"{equity['Gini']:.3f}",
+            help="Inequality of access across states, weighted by population (0 = equal access)"
+        )
+    with eq_col2:
+        st.metric(
+            label="Concentration Index",
+            value=f"{equity['Concentration Index']:+.3f}",
+            help="Access ranked by state urbanisation; positive values mean access is concentrated in more urbanised states"
+        )
+    with eq_col3:
+        st.metric(
+            label="Rural/Urban Ratio",
+            value=f"{equity['Rural/Urban Ratio']:.2f}",
+            help="Population-weighted rural access divided by urban access (1 = parity)"
+        )
+    with eq_col4:
+        st.metric(
+            label="Rural Gini",
+            value=f"{equity['Gini (Rural)']:.3f}",
+            help="Inequality of rural access across states, weighted by rural population"
+        )
     st.markdown("---")
     
     # === BOTTOM SECTION: VISUALIZATIONS SIDE BY SIDE ===
     viz_col1, viz_col2 = st.columns([1, 1])
     
     with viz_col1:
-        if variable_type == "hac_m":
-            viz_title = f"🗺️ Statewise distribution of: HAC-M {selected_time.split()[0]}"
-        else:
-            viz_title = f"🗺️ Statewise distribution of: HAC-W {selected_time.split()[0]}"
-        st.subheader(viz_title)
-        
-        # Create enhanced choropleth map using shapefile
-        color_label = "% Population"
-        color_scale = 'Viridis'
-        
-        # Create choropleth map using the proven approach
-        df_viz = df.copy()
-        
-        # Create the figure
-        fig_map = go.Figure(data=go.Choropleth(
-            geojson="https://gist.githubusercontent.com/jbrobst/56c13bbbf9d97d187fea01ca62ea5112/raw/e388c4cae20aa53cb5090210a42ebb9b765c0a36/india_states.geojson",
-            featureidkey='properties.ST_NM',
-            locationmode='geojson-id',
-            locations=df_viz['State'],
-            z=df_viz[total_col],
-            zmin=0,
-            zmax=100,
-            autocolorscale=False,
-            colorscale=color_scale,
-            marker_line_color='white',
-            marker_line_width=0.5,
-            hovertemplate='<b>%{location}</b><br>' + color_label + ': %{z:.1f}<extra></extra>',
-            colorbar=dict(
-                title={'text': color_label},
-                thickness=15,
-                len=0.6,
-                bgcolor='rgba(255,255,255,0.8)',
-                xanchor='left',
-                x=0.01,
-                yanchor='bottom',
-                y=0.1,
-                tick0=0,
-                dtick=20
-            )
-        ))
-        
-        # Update geos
-        fig_map.update_geos(
-            visible=False,
-            projection=dict(
-                type='conic conformal',
-                parallels=[12.472944444, 35.172805555556],
-                rotation={'lat': 24, 'lon': 80}
-            ),
-            lonaxis={'range': [68, 98]},
-            lataxis={'range': [6, 38]}
-        )
-        
-        # Update layout
-        fig_map.update_layout(
-            margin={'r': 0, 't': 0, 'l': 0, 'b': 0},
-            height=800,
-            width=None
-        )
-        
-        st.plotly_chart(fig_map, use_container_width=True)
-        
-        # Add dynamic description below the map
+        # Map mode: aggregated state polygons or the high-density grid tiles
+        seed_widget_from_query_param("map_mode", "map", MAP_MODE_OPTIONS, "State choropleth")
+        map_mode = MAP_MODE_OPTIONS[st.radio(
+            "Map Mode:",
+            options=list(MAP_MODE_OPTIONS.keys()),
+            key="map_mode",
+            horizontal=True,
+            help="The high-density grid shows pre-binned accessibility cells from the local grid tiles file"
+        )]
+        sync_query_params({"map": map_mode}, stale=GRID_QUERY_PARAMS if map_mode == "choropleth" else ())
+
         transport_type = "motorized transport" if variable_type == "hac_m" else "walking"
         time_threshold = selected_time.split()[0]
 
-        st.markdown(f"""
-        <div style="text-align: center; margin-top: -50px; margin-bottom: 40px; color: #666; font-size: 14px; font-weight: 500;">
-            % population within {time_threshold} min to nearest health center via {transport_type}
-        </div>
-        """, unsafe_allow_html=True)
+        if map_mode == "choropleth":
+            if variable_type == "hac_m":
+                viz_title = f"🗺️ Statewise distribution of: HAC-M {selected_time.split()[0]}"
+            else:
+                viz_title = f"🗺️ Statewise distribution of: HAC-W {selected_time.split()[0]}"
+            st.subheader(viz_title)
+            
+            # Cached per variable/threshold (pre-built by the startup warmer)
+            fig_map = build_state_map(variable_type, time_value)
+            
+            st.plotly_chart(fig_map, use_container_width=True)
+            
+            # Add dynamic description below the map
+            st.markdown(f"""
+            <div style="text-align: center; margin-top: -50px; margin-bottom: 40px; color: #666; font-size: 14px; font-weight: 500;">
+                % population within {time_threshold} min to nearest health center via {transport_type}
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            if variable_type == "hac_m":
+                viz_title = f"🗺️ Gridded distribution of: HAC-M {selected_time.split()[0]}"
+            else:
+                viz_title = f"🗺️ Gridded distribution of: HAC-W {selected_time.split()[0]}"
+            st.subheader(viz_title)
+
+            tiles_version = grid_tiles_version()
+            if tiles_version is None:
+                st.info(f"📍 Grid tiles file '{GRID_TILES_FILE}' or its index '{GRID_TILES_INDEX_FILE}' not found. Build it from gridded accessibility points with `python build_grid_tiles.py <points file>`.")
+                sync_query_params({}, stale=GRID_QUERY_PARAMS)
+            else:
+                tile_index = load_grid_tile_index(tiles_version)
+                grid_col1, grid_col2 = st.columns(2)
+                with grid_col1:
+                    # Focus extent decides which level of detail is sent to the browser
+                    focus_options = {"All India": "India"}
+                    focus_options.update({
+                        state: state for state in sorted(tile_index['State'].unique()) if state != 'India'
+                    })
+                    seed_widget_from_query_param("grid_focus", "focus", focus_options, "All India")
+                    grid_focus = st.selectbox(
+                        "Focus:",
+                        options=list(focus_options.keys()),
+                        key="grid_focus",
+                        help="Narrowing the focus loads finer grid cells for that state"
+                    )
+                with grid_col2:
+                    seed_widget_from_query_param("grid_metric", "cell", GRID_METRIC_OPTIONS, "% within threshold")
+                    grid_metric = GRID_METRIC_OPTIONS[st.radio(
+                        "Cell Metric:",
+                        options=list(GRID_METRIC_OPTIONS.keys()),
+                        key="grid_metric",
+                        horizontal=True
+                    )]
+                sync_query_params({"focus": focus_options[grid_focus], "cell": grid_metric})
+
+                # "All India" uses the state-agnostic 'India' cells, so border cells are not drawn twice
+                focus_state = focus_options[grid_focus]
+                grid_level = choose_grid_level(tile_index, focus_state)
+                level_blocks = tile_index[
+                    (tile_index['level'] == grid_level) & (tile_index['State'] == focus_state)
+                ]
+
+                if grid_metric == "within":
+                    value_col = total_col.rsplit('_', 1)[0]
+                else:
+                    value_col = "travel_time_m" if variable_type == "hac_m" else "travel_time_w"
+
+                # Cached per level, focus, column and metric
+                st.pydeck_chart(
+                    build_grid_deck(tiles_version, grid_level, focus_state, value_col, grid_metric, transport_type),
+                    use_container_width=True,
+                    height=700
+                )
+
+                if grid_metric == "within":
+                    grid_description = f"% population within {time_threshold} min to nearest health center via {transport_type}"
+                else:
+                    grid_description = f"Mean travel time to nearest health center via {transport_type}"
+                st.caption(f"{grid_description} · {int(level_blocks['cells'].sum()):,} cells of {float(level_blocks['cell_size'].iloc[0]):g}° (level {grid_level})")
     
     with viz_col2:
         if variable_type == "hac_m":
@@ -375,74 +1061,9 @@ if view_selection == "🗺️ Variable View":
             range_title = f"📊 Rural vs Urban: HAC-W {selected_time.split()[0]}"
         st.subheader(range_title)
         
-        # Rural vs Urban Comparison (Range Plot)
-        if rural_col and urban_col:
-            # Use the original loaded data
-            df_range = load_data()
-            
-            # Ensure we have all original states including J&K
-            if df_range is not None:
-                df_sorted = df_range.sort_values(total_col, ascending=True)
-            else:
-                df_sorted = df.sort_values(total_col, ascending=True)
-            
-            fig_range = go.Figure()
-            
-            # Add rural values
-            fig_range.add_trace(go.Scatter(
-                x=df_sorted[rural_col],
-                y=df_sorted['State'],
-                mode='markers',
-                name='Rural',
-                marker=dict(color='#FF6B6B', size=10, symbol='circle'),
-                hovertemplate='<b>%{y}</b><br>Rural: %{x:.1f}%<extra></extra>'
-            ))
-            
-            # Add urban values  
-            fig_range.add_trace(go.Scatter(
-                x=df_sorted[urban_col],
-                y=df_sorted['State'],
-                mode='markers',
-                name='Urban',
-                marker=dict(color='#4ECDC4', size=10, symbol='diamond'),
-                hovertemplate='<b>%{y}</b><br>Urban: %{x:.1f}%<extra></extra>'
-            ))
-            
-            # Add range lines
-            for idx, row in df_sorted.iterrows():
-                fig_range.add_trace(go.Scatter(
-                    x=[row[rural_col], row[urban_col]],
-                    y=[row['State'], row['State']],
-                    mode='lines',
-                    line=dict(color='#A8DADC', width=3),
-                    showlegend=False,
-                    hoverinfo='skip'
-                ))
-            
-            fig_range.update_layout(
-                xaxis_title=f"% population within {time_threshold} min to nearest center via {transport_type}",
-                yaxis_title="",
-                height=800,
-                hovermode='closest',
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                margin=dict(l=0, r=0, t=0, b=0),
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="center",
-                    x=0.5,
-                    bgcolor='rgba(255,255,255,0.8)',
-                    bordercolor='rgba(0,0,0,0.2)',
-                    borderwidth=1
-                )
-            )
-            
-            fig_range.update_xaxes(gridcolor='lightgray', gridwidth=0.5)
-            fig_range.update_yaxes(gridcolor='lightgray', gridwidth=0.5)
-            
-            st.plotly_chart(fig_range, use_container_width=True)
+        # Rural vs Urban Comparison (Range Plot), cached per variable/threshold
+        fig_range = build_rural_urban_range(variable_type, time_value)
+        st.plotly_chart(fig_range, use_container_width=True)
 
 else:  # State View
     # STATE VIEW - Original state_view.py content
@@ -454,48 +1075,36 @@ else:  # State View
     filter_col1, filter_col2 = st.columns(2)
     
     # Get list of states (excluding India which is the total row)
-    states = [state for state in df['State'].unique() if state != 'India']
-    states.sort()  # Sort alphabetically
-    
-    # Get all variable columns (excluding State and population columns)
-    population_cols = ['Total_Population', 'Rural_Population', 'Urban_Population']
-    all_variable_columns = [col for col in df.columns if col not in ['State'] + population_cols]
-    
-    # Filter to only include "Total" variables (exclude Rural and Urban variants)
-    total_variable_columns = [col for col in all_variable_columns if col.endswith('_Total')]
+    states = get_states(df)
     
     # Create user-friendly variable names for Total variables only
-    variable_display_names = {}
-    for col in total_variable_columns:
-        if col.startswith('HAC_M_'):
-            # HAC Motorized transport
-            parts = col.split('_')
-            time = parts[2]
-            display_name = f"HAC-M {time}min"
-        elif col.startswith('HAC_W_'):
-            # HAC Walking
-            parts = col.split('_')
-            time = parts[2]
-            display_name = f"HAC-W {time}min"
-        else:
-            display_name = col
-        variable_display_names[display_name] = col
+    variable_display_names = get_variable_display_names(df.columns)
     
     with filter_col1:
         # State selection (single choice)
+        seed_widget_from_query_param("selected_state", "state", {state: state for state in states}, states[0])
         selected_state = st.selectbox(
             "🏛️ Select State:",
             options=states,
-            index=0,
+            key="selected_state",
             help="Choose a state to analyze its healthcare accessibility metrics"
         )
     
     with filter_col2:
-        # Variable selection (multiple choice - up to 5)
+        # Variable selection (multiple choice - up to 5), seeded from the "vars" link parameter
+        if "selected_variables" not in st.session_state:
+            display_names_by_col = {col: name for name, col in variable_display_names.items()}
+            linked_variables = [
+                display_names_by_col[col] for col in st.query_params.get_all("vars")
+                if col in display_names_by_col
+            ]
+            st.session_state["selected_variables"] = (
+                linked_variables[:5] or default_state_view_variables(variable_display_names)
+            )
         selected_variables = st.multiselect(
             "📊 Select Variables (max 5):",
             options=list(variable_display_names.keys()),
-            default=list(variable_display_names.keys())[:5],  # Default to first 5
+            key="selected_variables",
             max_selections=5,
             help="Choose up to 5 healthcare accessibility variables to compare"
         )
@@ -503,6 +1112,9 @@ else:  # State View
     # Convert selected variable display names back to column names
     selected_variable_columns = [variable_display_names[var] for var in selected_variables]
     
+    # Keep the URL in sync so the current selection can be shared as a link
+    sync_query_params({"state": selected_state, "vars": selected_variable_columns})
+    
     # Display national values and radar chart side by side
     if selected_variables:
         # Create three columns: tiles on left, radar chart in middle, range plot on right
@@ -530,55 +1142,9 @@ else:  # State View
             with radar_col:
                 st.markdown("<h3 style='text-align: center;'>State Comparison</h3>", unsafe_allow_html=True)
                 
-                # Prepare data for radar chart
-                categories = selected_variables[:5]  # Limit to 5 for better visualization
-                national_values = [india_data[col] for col in selected_variable_columns[:5]]
-                state_values = [state_data[col] for col in selected_variable_columns[:5]]
-                
-                # Create radar chart
-                fig = go.Figure()
-                
-                # Add national values (first web)
-                fig.add_trace(go.Scatterpolar(
-                    r=national_values,
-                    theta=categories,
-                    fill='toself',
-                    name='India',
-                    line=dict(color='#4ECDC4', width=2),
-                    fillcolor='rgba(78, 205, 196, 0.2)'
-                ))
-                
-                # Add state values (second web)
-                fig.add_trace(go.Scatterpolar(
-                    r=state_values,
-                    theta=categories,
-                    fill='toself',
-                    name=selected_state,
-                    line=dict(color='#FF6B6B', width=2),
-                    fillcolor='rgba(255, 107, 107, 0.2)'
-                ))
-                
-                # Update layout with proper configuration
-                fig.update_layout(
-                    polar=dict(
-                        radialaxis=dict(
-                            visible=True,
-                            range=[0, 100],
-                            ticksuffix='%'
-                        )
-                    ),
-                    showlegend=True,
-                    height=500,
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="center",
-                        x=0.5
-                    ),
-                    # Enable proper plotly controls
-                    margin=dict(l=50, r=50, t=50, b=50)
-                )
+                # Cached per state and variable selection (defaults pre-built by the startup warmer)
+                categories = tuple(selected_variables[:5])  # Limit to 5 for better visualization
+                fig = build_state_radar(selected_state, categories, tuple(selected_variable_columns[:5]))
                 
                 # Display chart with config for zoom/pan/reset
                 st.plotly_chart(
@@ -604,101 +1170,11 @@ else:  # State View
             with range_col:
                 st.markdown("<h3 style='text-align: center;'>Rural-Urban Gap</h3>", unsafe_allow_html=True)
                 
-                # Get variables that have rural and urban data
-                rural_urban_variables = []
-                for display_name, col_name in zip(selected_variables[:5], selected_variable_columns[:5]):
-                    # Check if rural and urban columns exist for this variable
-                    rural_col = col_name.replace('_Total', '_Rural')
-                    urban_col = col_name.replace('_Total', '_Urban')
-                    
-                    if rural_col in df.columns and urban_col in df.columns:
-                        rural_urban_variables.append({
-                            'display_name': display_name,
-                            'rural_col': rural_col,
-                            'urban_col': urban_col,
-                            'rural_value': state_data[rural_col],
-                            'urban_value': state_data[urban_col]
-                        })
+                fig_range = build_state_rural_urban_gap(
+                    selected_state, tuple(selected_variables[:5]), tuple(selected_variable_columns[:5])
+                )
                 
-                if rural_urban_variables:
-                    # Create range plot
-                    fig_range = go.Figure()
-                    
-                    # Prepare data for the plot
-                    variable_names = [var['display_name'] for var in rural_urban_variables]
-                    rural_values = [var['rural_value'] for var in rural_urban_variables]
-                    urban_values = [var['urban_value'] for var in rural_urban_variables]
-                    
-                    # Add rural values
-                    fig_range.add_trace(go.Scatter(
-                        x=rural_values,
-                        y=variable_names,
-                        mode='markers',
-                        name='Rural',
-                        marker=dict(color='#FF6B6B', size=10, symbol='circle'),
-                        hovertemplate='<b>%{y}</b><br>Rural: %{x:.1f}%<extra></extra>'
-                    ))
-                    
-                    # Add urban values
-                    fig_range.add_trace(go.Scatter(
-                        x=urban_values,
-                        y=variable_names,
-                        mode='markers',
-                        name='Urban',
-                        marker=dict(color='#4ECDC4', size=10, symbol='diamond'),
-                        hovertemplate='<b>%{y}</b><br>Urban: %{x:.1f}%<extra></extra>'
-                    ))
-                    
-                    # Add range lines connecting rural and urban values
-                    for i, var in enumerate(rural_urban_variables):
-                        fig_range.add_trace(go.Scatter(
-                            x=[var['rural_value'], var['urban_value']],
-                            y=[var['display_name'], var['display_name']],
-                            mode='lines',
-                            line=dict(color='#A8DADC', width=3),
-                            showlegend=False,
-                            hoverinfo='skip'
-                        ))
-                    
-                    # Update layout
-                    fig_range.update_layout(
-                        xaxis_title="Percentage (%)",
-                        yaxis_title="",
-                        height=400,
-                        hovermode='closest',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        margin=dict(l=0, r=0, t=0, b=0),
-                        legend=dict(
-                            orientation="h",
-                            yanchor="bottom",
-                            y=1.02,
-                            xanchor="center",
-                            x=0.5,
-                            bgcolor='rgba(255,255,255,0.8)',
-                            bordercolor='rgba(0,0,0,0.2)',
-                            borderwidth=1
-                        ),
-                        yaxis=dict(side='left'),  # Only show left y-axis
-                        showlegend=True
-                    )
-                    
-                    # Remove axis lines, keep only horizontal grid
-                    fig_range.update_xaxes(
-                        showline=False,
-                        showgrid=False,
-                        zeroline=False,
-                        range=[0, None],  # Start x-axis from 0
-                        tick0=0,  # Start ticks from 0
-                        dtick=20  # Tick interval
-                    )
-                    fig_range.update_yaxes(
-                        showline=False,
-                        showgrid=True,
-                        gridcolor='lightgray',
-                        gridwidth=0.5
-                    )
-                    
+                if fig_range is not None:
                     st.plotly_chart(fig_range, use_container_width=True)
                     
                     # Add centered subtitle below the chart
@@ -716,3 +1192,26 @@ else:  # State View
                 st.error("❌ National data (India row) not found in dataset")
             if state_row.empty:
                 st.error(f"❌ Data for {selected_state} not found in dataset")
+
+        # Equity measures for the selected variables, from the cached inequality cube
+        st.markdown("---")
+        st.markdown("<h3 style='text-align: center;'>Equity Measures</h3>", unsafe_allow_html=True)
+        
+        equity_table = compute_inequality_cube().loc[selected_variable_columns[:5]].copy()
+        if not state_row.empty:
+            # The state's own rural-urban gap ratio alongside the national measures
+            rural_cols = [col.replace('_Total', '_Rural') for col in selected_variable_columns[:5]]
+            urban_cols = [col.replace('_Total', '_Urban') for col in selected_variable_columns[:5]]
+            equity_table[f"{selected_state} Rural/Urban Ratio"] = (
+                state_row[rural_cols].to_numpy(dtype=float)[0] / state_row[urban_cols].to_numpy(dtype=float)[0]
+            )
+        equity_table.index = selected_variables[:5]
+        
+        st.dataframe(
+            equity_table.style.format(precision=3).format('{:.1f}', subset=['Mean (%)']),
+            use_container_width=True
+        )
+        st.caption(
+            "Gini and concentration index are population-weighted across states (concentration index ranks "
+            "states by urbanisation). Rural/Urban Ratio divides rural by urban access; 1 means parity."
+        )